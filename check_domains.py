@@ -6,27 +6,195 @@ across multiple top-level domains defined in a configuration file.
 """
 
 import yaml
-import whois
+import dns.exception
+import dns.resolver
+import aiodns
+import aiodns.error
+import aiohttp
 import argparse
-from typing import List, Tuple
+import asyncio
+import hashlib
+import itertools
+import json
+import logging
+import math
+import multiprocessing
+import os
+import queue
+import re
+import shelve
+import socket
+import struct
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
 
+# libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-def load_config(config_file: str) -> List[str]:
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on WHOIS lookups in flight at once; WHOIS servers start
+# rate limiting well before ephemeral ports run out.
+DEFAULT_CONCURRENCY = 50
+
+# Domains handed to a worker process at a time in --procs mode
+PROCESS_CHUNK_SIZE = 32
+
+# Lookups (or chunks, in --procs mode) queued per worker; input is pulled
+# lazily as these complete, so memory stays bounded on huge combination sets.
+IN_FLIGHT_PER_WORKER = 2
+
+DEFAULT_CACHE_FILE = os.path.expanduser("~/.check_domains_cache")
+DEFAULT_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Persistent (timestamp, registered) results keyed by domain; None when disabled.
+_cache: Optional[shelve.Shelf] = None
+_cache_ttl = DEFAULT_CACHE_TTL
+_cache_lock = threading.Lock()
+
+# Short timeouts keep a slow nameserver from stalling a lookup; anything
+# short of a positive answer falls through to WHOIS anyway.
+_resolver = dns.resolver.Resolver()
+_resolver.timeout = 2
+_resolver.lifetime = 2
+
+# Transient WHOIS failures (timeouts, refused connections, quota) are
+# retried with exponential backoff: 0.2 s, then 0.4 s.
+WHOIS_ATTEMPTS = 3
+WHOIS_BACKOFF = 0.2  # seconds
+
+WHOIS_PORT = 43
+WHOIS_TIMEOUT = 10  # seconds
+IANA_WHOIS_SERVER = "whois.iana.org"
+
+# Registry WHOIS servers for common TLDs; others are looked up at IANA
+# once per run.
+TLD_WHOIS_SERVERS = {
+    "com": "whois.verisign-grs.com",
+    "net": "whois.verisign-grs.com",
+    "org": "whois.publicinterestregistry.org",
+    "ngo": "whois.publicinterestregistry.org",
+    "info": "whois.nic.info",
+    "xyz": "whois.nic.xyz",
+    "io": "whois.nic.io",
+    "ai": "whois.nic.ai",
+    "me": "whois.nic.me",
+    "app": "whois.nic.google",
+    "dev": "whois.nic.google",
+}
+
+# What each registry answers, lowercased, when a domain has no record
+NOT_FOUND_MARKERS = {
+    "com": (b'no match for "',),
+    "net": (b'no match for "',),
+    "org": (b"domain not found",),
+    "ngo": (b"domain not found",),
+    "info": (b"domain not found",),
+    "xyz": (b"the queried object does not exist", b"domain not found"),
+    "io": (b"domain not found", b"is available for purchase"),
+    "ai": (b"domain not found", b"no object found"),
+    "me": (b"domain not found",),
+    "app": (b"domain not found",),
+    "dev": (b"domain not found",),
+}
+
+# Fallback for TLDs without markers above: the phrases registries
+# commonly use, in one pattern so a response is scanned once.
+_WHOIS_NOT_FOUND = re.compile(
+    rb"no match|not found|no data found|no entries found|no matching objects"
+    rb"|object does not exist|not registered|is available for (?:registration|purchase)"
+    rb"|status:\s*(?:available|free)\b")
+_WHOIS_RATE_LIMITED = re.compile(rb"quota exceeded|limit exceeded|too many (?:requests|queries)")
+
+# WHOIS servers close the connection after every answer (RFC 3912), so
+# sockets can't be reused; what is shared is the server found for each
+# TLD, which otherwise costs an extra query to IANA.
+_whois_servers: Dict[str, Optional[str]] = {}
+_whois_servers_lock = threading.Lock()
+
+# A resolver that fails this many lookups in a row is benched ("sent to
+# purgatory") for the given sentence before it is tried again.
+DEFAULT_PURGATORY_THRESHOLD = 5
+DEFAULT_PURGATORY_SENTENCE_MS = 5000
+
+# c-ares errors that count against the resolver; others, such as a
+# misformatted name, are about the query and leave its record alone.
+_RESOLVER_FAILURES = frozenset({aiodns.error.ARES_ETIMEOUT, aiodns.error.ARES_ECONNREFUSED,
+                                aiodns.error.ARES_ESERVFAIL})
+
+# Status lines are buffered and written to stdout in chunks of about this
+# many bytes; results flush the buffer immediately.
+OUTPUT_BUFFER_SIZE = 4096
+_output = bytearray()
+
+# WHOISXML API domain availability endpoint, queried in batches
+BULK_API_URL = "https://domain-availability.whoisxmlapi.com/api/v1"
+BULK_BATCH_SIZE = 100
+
+# Registration status for the API's conclusive answers; anything else
+# (e.g. UNDETERMINED) is left to a regular lookup
+_BULK_AVAILABILITY = {"UNAVAILABLE": True, "AVAILABLE": False}
+
+# IANA's registry of RDAP base URLs per TLD (RFC 9224)
+RDAP_BOOTSTRAP_URL = "https://data.iana.org/rdap/dns.json"
+
+# Keep-alive connections held open to RDAP servers, in total and per
+# server, and how long their resolved addresses are reused (seconds)
+RDAP_CONNECTION_LIMIT = 100
+RDAP_CONNECTION_LIMIT_PER_HOST = 20
+RDAP_DNS_CACHE_TTL = 300
+
+
+def _read_config(config_file: str) -> dict:
     """
-    Load top-level domains from a YAML configuration file.
+    Read a YAML configuration file.
 
     Args:
         config_file: Path to the YAML configuration file
 
     Returns:
-        List of top-level domains
+        Parsed configuration, or an empty dict if the file doesn't exist
     """
     try:
         with open(config_file, 'r') as file:
-            config = yaml.safe_load(file)
-        return config.get('top_level_domains', [])
+            return yaml.load(file, Loader=_YamlLoader) or {}
     except FileNotFoundError:
-        return []
+        return {}
+
+
+def load_config(config_file: str) -> List[str]:
+    """
+    Load top-level domains from a YAML configuration file.
+
+    Args:
+        config_file: Path to the YAML configuration file
+
+    Returns:
+        List of top-level domains
+    """
+    return _read_config(config_file).get('top_level_domains', [])
+
+
+def load_resolvers(config_file: str) -> List[str]:
+    """
+    Load DNS resolver addresses from a YAML configuration file.
+
+    Args:
+        config_file: Path to the YAML configuration file
+
+    Returns:
+        List of resolver IP addresses; empty to use the system resolver
+    """
+    return _read_config(config_file).get('resolvers', [])
 
 
 def load_strings(input_file: str) -> List[str]:
@@ -46,83 +214,1071 @@ def load_strings(input_file: str) -> List[str]:
         return []
 
 
-def check_domain(domain: str) -> bool:
+def open_cache(cache_file: str = DEFAULT_CACHE_FILE, ttl: float = DEFAULT_CACHE_TTL) -> None:
+    """
+    Open the on-disk lookup cache used by check_domain.
+
+    Args:
+        cache_file: Path of the shelve file backing the cache
+        ttl: Seconds a cached result stays valid
+    """
+    global _cache, _cache_ttl
+    close_cache()
+    _cache = shelve.open(cache_file)
+    _cache_ttl = ttl
+
+
+def close_cache() -> None:
+    """
+    Close the on-disk lookup cache, if one is open.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+            _cache = None
+
+
+def _cached_result(domain: str) -> Optional[bool]:
+    """
+    Look up a fresh cached result for a domain.
+
+    Args:
+        domain: Domain name to look up
+
+    Returns:
+        The cached registration status, or None if missing or expired
+    """
+    with _cache_lock:
+        if _cache is None or domain not in _cache:
+            return None
+        checked_at, registered = _cache[domain]
+    if time.time() - checked_at >= _cache_ttl:
+        return None
+    return registered
+
+
+def _store_result(domain: str, registered: bool) -> None:
+    """
+    Record a lookup result in the cache, if one is open.
+
+    Args:
+        domain: Domain name that was checked
+        registered: Whether the domain is registered
+    """
+    with _cache_lock:
+        if _cache is not None:
+            _cache[domain] = (time.time(), registered)
+
+
+def check_domain(domain: str, strict: bool = False) -> bool:
     """
     Check if a domain is registered.
 
+    Results are served from the on-disk cache when it is open and holds
+    a fresh entry for the domain. Otherwise a domain with delegated
+    nameservers is registered; anything else is settled by WHOIS, since
+    a registered domain need not be delegated. If WHOIS keeps failing
+    the domain is assumed registered, and that guess is not cached.
+
     Args:
         domain: Domain name to check
+        strict: Confirm a cached "available" again, since the async path
+            may have cached it from NXDOMAIN
 
     Returns:
         True if domain is registered, False otherwise
     """
+    registered = _cached_result(domain)
+    if strict and registered is False:
+        registered = None  # May have come from NXDOMAIN; confirm it
+    if registered is None:
+        registered = _lookup(domain)
+        if registered is None:
+            return True  # Unknown: don't report a domain as available on a network error
+        _store_result(domain, registered)
+    return registered
+
+
+def _check_whois(domain: str) -> bool:
+    """
+    Check if a domain is registered with WHOIS alone, caching the answer.
+
+    For callers that have already asked DNS. As in check_domain, a domain
+    WHOIS can't settle is assumed registered and not cached.
+
+    Args:
+        domain: Domain name to check
+
+    Returns:
+        True if domain is registered, False otherwise
+    """
+    registered = _whois_registered(domain)
+    if registered is None:
+        return True
+    _store_result(domain, registered)
+    return registered
+
+
+def _lookup(domain: str) -> Optional[bool]:
+    """
+    Check if a domain is registered, bypassing the cache.
+
+    Args:
+        domain: Domain name to check
+
+    Returns:
+        True if domain is registered, False otherwise, None if unknown
+    """
+    return _has_nameservers(domain) or _whois_registered(domain)
+
+
+def _has_nameservers(domain: str) -> bool:
+    """
+    Check if a domain has NS records in DNS.
+
+    Args:
+        domain: Domain name to check
+
+    Returns:
+        True if the domain resolves to nameservers, False otherwise
+    """
+    try:
+        _resolver.resolve(domain, 'NS')
+        return True
+    except dns.exception.DNSException:
+        return False  # NXDOMAIN, no answer or timeout: not conclusive
+
+
+def _whois_request(server: str, query: str) -> bytes:
+    """
+    Send one WHOIS query and read the response until the server closes.
+
+    Args:
+        server: WHOIS server hostname
+        query: Query line, without the trailing CRLF
+
+    Returns:
+        Raw response bytes
+
+    Raises:
+        OSError: If the server can't be reached or times out
+    """
+    with socket.create_connection((server, WHOIS_PORT), timeout=WHOIS_TIMEOUT) as sock:
+        sock.sendall(query.encode() + b"\r\n")
+        return b"".join(iter(lambda: sock.recv(4096), b""))
+
+
+def _whois_server(domain: str) -> Optional[str]:
+    """
+    Find the WHOIS server for a domain's TLD, remembering it for later lookups.
+
+    Args:
+        domain: Domain name to look up
+
+    Returns:
+        WHOIS server hostname, or None if the TLD has none
+
+    Raises:
+        OSError: If IANA can't be reached
+    """
+    tld = domain.split('.', 1)[-1]
+    if tld in TLD_WHOIS_SERVERS:
+        return TLD_WHOIS_SERVERS[tld]
+    with _whois_servers_lock:
+        if tld in _whois_servers:
+            return _whois_servers[tld]
+    response = _whois_request(IANA_WHOIS_SERVER, tld.rsplit('.', 1)[-1])
+    match = re.search(rb"^whois:\s*(\S+)", response, re.MULTILINE | re.IGNORECASE)
+    server = match.group(1).decode() if match else None
+    with _whois_servers_lock:
+        _whois_servers[tld] = server
+    return server
+
+
+def _whois_query(domain: str) -> bytes:
+    """
+    Query the registry's WHOIS server for a domain.
+
+    Only the registry is asked; following its referral to the registrar
+    would add a connection without changing the answer.
+
+    Args:
+        domain: Domain name to look up
+
+    Returns:
+        Raw WHOIS response
+
+    Raises:
+        LookupError: If the TLD has no WHOIS server
+        OSError: If the server can't be reached
+    """
+    server = _whois_server(domain)
+    if server is None:
+        raise LookupError(f"No WHOIS server for {domain}")
+    return _whois_request(server, domain)
+
+
+def _whois_registered(domain: str) -> Optional[bool]:
+    """
+    Check if a domain is registered with a live WHOIS query.
+
+    The registry's response is only scanned for its "not found" marker;
+    it isn't parsed.
+
+    Args:
+        domain: Domain name to check
+
+    Returns:
+        True if domain is registered, False if WHOIS has no record of it,
+        None if the TLD has no WHOIS server or every attempt failed with
+        a transient error
+    """
+    markers = NOT_FOUND_MARKERS.get(domain.split('.', 1)[-1])
+    for attempt in range(WHOIS_ATTEMPTS):
+        try:
+            response = _whois_query(domain).lower()
+        except LookupError:
+            return None  # No WHOIS server for the TLD: can't tell
+        except OSError:  # socket.timeout and ConnectionError included
+            pass
+        else:
+            if response.strip() and not _WHOIS_RATE_LIMITED.search(response):
+                if markers is None:
+                    return _WHOIS_NOT_FOUND.search(response) is None
+                return not any(marker in response for marker in markers)
+        if attempt + 1 < WHOIS_ATTEMPTS:
+            time.sleep(WHOIS_BACKOFF * 2 ** attempt)
+    return None
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over domain names.
+
+    Built from a TLD's zone file, it answers "definitely not delegated"
+    without any network traffic. Membership tests may return false
+    positives, at roughly the error rate it was sized for, but never
+    false negatives.
+    """
+
+    _HEADER = struct.Struct('<4sIQ')  # magic, hash count, size in bits
+    _MAGIC = b'CDBF'
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self._size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _positions(self, name: str) -> Iterator[int]:
+        # Double hashing: k positions from the two halves of one digest
+        digest = hashlib.blake2b(name.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self._hashes):
+            yield (first + i * second) % self._size
+
+    def add(self, name: str) -> None:
+        """
+        Add a domain name to the filter.
+
+        Args:
+            name: Domain name to add
+        """
+        for position in self._positions(name):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, name: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7))
+                   for position in self._positions(name))
+
+    def save(self, path: str) -> None:
+        """
+        Write the filter to a file.
+
+        Args:
+            path: Destination file path
+        """
+        with open(path, 'wb') as file:
+            file.write(self._HEADER.pack(self._MAGIC, self._hashes, self._size))
+            file.write(self._bits)
+
+    @classmethod
+    def load(cls, path: str) -> "BloomFilter":
+        """
+        Read a filter written by save.
+
+        Args:
+            path: Source file path
+
+        Returns:
+            The loaded filter
+
+        Raises:
+            ValueError: If the file isn't a saved filter
+        """
+        with open(path, 'rb') as file:
+            magic, hashes, size = cls._HEADER.unpack(file.read(cls._HEADER.size))
+            bits = bytearray(file.read())
+        if magic != cls._MAGIC or len(bits) != (size + 7) // 8:
+            raise ValueError(f"Not a Bloom filter file: {path}")
+        bloom = cls.__new__(cls)
+        bloom._size, bloom._hashes, bloom._bits = size, hashes, bits
+        return bloom
+
+
+def build_bloom_filter(zone_file: str, tld: str, error_rate: float = 0.001) -> BloomFilter:
+    """
+    Build a Bloom filter of the domains delegated in a TLD's zone file.
+
+    Args:
+        zone_file: Path to the zone file, e.g. from ICANN CZDS
+        tld: Top-level domain the zone file is for
+        error_rate: Target false positive rate
+
+    Returns:
+        Filter containing every registrable domain with records in the zone
+    """
+    suffix = f".{tld}"
+    depth = tld.count('.') + 1
+
+    def owners() -> Iterator[str]:
+        with open(zone_file, 'r') as file:
+            for line in file:
+                if not line.strip() or line.startswith((';', '$')):
+                    continue
+                owner = line.split(None, 1)[0].lower().rstrip('.')
+                if owner.endswith(suffix) and owner.count('.') == depth:
+                    yield owner
+
+    # Zone files list several records per domain, so this overestimates
+    # the capacity, which only lowers the false positive rate.
+    bloom = BloomFilter(sum(1 for _ in owners()), error_rate)
+    for owner in owners():
+        bloom.add(owner)
+    return bloom
+
+
+def load_bloom_filters(directory: str, tlds: List[str]) -> Dict[str, BloomFilter]:
+    """
+    Load the saved Bloom filters for a set of TLDs.
+
+    Args:
+        directory: Directory holding one `<tld>.bloom` file per TLD
+        tlds: TLDs to load filters for
+
+    Returns:
+        Filters keyed by TLD; TLDs without a file are left out
+    """
+    bloom_filters = {}
+    for tld in filter(None, map(_canonical_name, tlds)):
+        path = os.path.join(directory, f"{tld}.bloom")
+        if os.path.exists(path):
+            bloom_filters[tld] = BloomFilter.load(path)
+    return bloom_filters
+
+
+def _canonical_name(name: str) -> Optional[str]:
+    """
+    Canonicalize a domain label or TLD for lookup.
+
+    Args:
+        name: Base string or TLD as written in the input
+
+    Returns:
+        The lowercase IDNA (punycode) form, or None if the name isn't
+        valid IDNA (e.g. an empty or over-long label)
+    """
+    name = name.strip().lower().lstrip('.')
     try:
-        whois.whois(domain)
-        return True  # Domain is registered
-    except Exception:
-        return False  # Domain is not registered or error occurred
+        return name.encode('idna').decode('ascii')
+    except UnicodeError:
+        return None
 
 
-def generate_domain_combinations(base_strings: List[str], tlds: List[str]) -> List[Tuple[str, str]]:
+def generate_domain_combinations(base_strings: List[str], tlds: List[str]) -> Iterator[Tuple[str, str]]:
     """
     Generate all combinations of base strings and TLDs.
 
+    Inputs are canonicalized (lowercase, IDNA) and deduplicated first so
+    that no domain is looked up twice; names that aren't valid IDNA are
+    dropped, as no lookup could resolve them. Combinations are grouped by TLD,
+    so consecutive lookups go to the same registry servers while their
+    addresses are still cached. They are produced lazily; wrap the
+    result in list() if you need its length.
+
     Args:
         base_strings: List of base string names
         tlds: List of top-level domains
 
     Returns:
-        List of tuples containing (full domain name, base string)
+        Iterator of tuples containing (full domain name, base string)
     """
-    return [(f"{base}.{tld}", base) for base in base_strings for tld in tlds]
+    unique_bases = list(dict.fromkeys(filter(None, map(_canonical_name, base_strings))))
+    unique_tlds = list(dict.fromkeys(filter(None, map(_canonical_name, tlds))))
+
+    dropped = len(base_strings) + len(tlds) - len(unique_bases) - len(unique_tlds)
+    if dropped:
+        logger.warning("Dropped %d duplicate, empty or invalid base strings and TLDs", dropped)
+
+    return ((f"{base}.{tld}", base) for tld, base in itertools.product(unique_tlds, unique_bases))
 
 
-def find_available_domains(domain_combinations: List[Tuple[str, str]],
-                           status_callback=None) -> List[str]:
+def _init_worker() -> None:
+    """
+    Detach a worker process from the parent's cache; only the parent writes it.
+    """
+    global _cache
+    _cache = None
+
+
+def _lookup_chunk(domains: List[str], threads: int) -> List[Tuple[str, Optional[bool]]]:
+    """
+    Check a chunk of domains on a thread pool inside a worker process.
+
+    Args:
+        domains: Domain names to check
+        threads: Number of worker threads
+
+    Returns:
+        List of (domain, registered) tuples; registered is None if unknown
+    """
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(zip(domains, executor.map(_lookup, domains)))
+
+
+def _iter_available_domains_processes(domain_combinations: Iterable[Tuple[str, str]],
+                                      status_callback,
+                                      concurrency: int,
+                                      processes: int,
+                                      strict: bool) -> Iterator[str]:
+    """
+    Yield available domains, checking them on a pool of worker processes.
+
+    Cached domains are answered as they are read. The rest are split into
+    chunks, each checked by a worker process on its own thread pool, so
+    the per-lookup Python overhead of DNS and WHOIS is spread across
+    interpreters while total concurrency stays at `concurrency`. Only a
+    few chunks per process are queued at a time; more input is read as
+    they complete.
+
+    Args:
+        domain_combinations: Iterable of (domain, base) tuples
+        status_callback: Optional callback function to report status
+        concurrency: Maximum number of lookups in flight across all processes
+        processes: Number of worker processes
+        strict: Check cached "available" answers again instead of trusting them
+
+    Yields:
+        Available domain names, in completion order
+    """
+    def report(results: List[Tuple[str, Optional[bool]]]) -> Iterator[str]:
+        for domain, registered in results:
+            if registered is None:
+                registered = True  # Unknown: assume registered, as check_domain does
+            else:
+                _store_result(domain, registered)
+            if status_callback:
+                status_callback(domain)
+            if not registered:
+                yield domain
+
+    def next_results() -> List[Tuple[str, Optional[bool]]]:
+        results = done.get()
+        if isinstance(results, BaseException):
+            raise results
+        return results
+
+    done = queue.SimpleQueue()
+    lookup = partial(_lookup_chunk, threads=max(1, concurrency // processes))
+    max_in_flight = processes * IN_FLIGHT_PER_WORKER
+    in_flight = 0
+    chunk = []
+    with multiprocessing.Pool(processes, initializer=_init_worker) as pool:
+        def submit(chunk: List[str]) -> None:
+            pool.apply_async(lookup, (chunk,), callback=done.put, error_callback=done.put)
+
+        for domain, _ in domain_combinations:
+            registered = _cached_result(domain)
+            if strict and registered is False:
+                registered = None  # May have come from NXDOMAIN; confirm it
+            if registered is None:
+                chunk.append(domain)
+                if len(chunk) == PROCESS_CHUNK_SIZE:
+                    if in_flight == max_in_flight:
+                        yield from report(next_results())
+                        in_flight -= 1
+                    submit(chunk)
+                    in_flight += 1
+                    chunk = []
+                continue
+            if status_callback:
+                status_callback(domain)
+            if not registered:
+                yield domain
+
+        if chunk:
+            submit(chunk)
+            in_flight += 1
+        while in_flight:
+            yield from report(next_results())
+            in_flight -= 1
+
+
+def iter_available_domains(domain_combinations: Iterable[Tuple[str, str]],
+                           status_callback=None,
+                           concurrency: int = DEFAULT_CONCURRENCY,
+                           processes: Optional[int] = None,
+                           strict: bool = False) -> Iterator[str]:
+    """
+    Yield available domains from a list of domain combinations.
+
+    Lookups run on a thread pool, or across worker processes if
+    `processes` is given; each available domain is yielded as soon as
+    its lookup completes. Input is read as lookups complete, so only a
+    couple of lookups per worker are queued at a time.
+
+    Args:
+        domain_combinations: Iterable of (domain, base) tuples
+        status_callback: Optional callback function to report status
+        concurrency: Number of worker threads
+        processes: Number of worker processes; threads only if None
+        strict: Check cached "available" answers again instead of trusting them
+
+    Yields:
+        Available domain names, in completion order
+    """
+    if processes:
+        yield from _iter_available_domains_processes(domain_combinations, status_callback,
+                                                     concurrency, processes, strict)
+        return
+
+    domains = (domain for domain, _ in domain_combinations)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {executor.submit(check_domain, domain, strict): domain
+                   for domain in itertools.islice(domains, concurrency * IN_FLIGHT_PER_WORKER)}
+
+        try:
+            while futures:
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    domain = futures.pop(future)
+                    for next_domain in itertools.islice(domains, 1):
+                        futures[executor.submit(check_domain, next_domain, strict)] = next_domain
+                    if status_callback:
+                        status_callback(domain)
+
+                    if not future.result():
+                        yield domain
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def find_available_domains(domain_combinations: Iterable[Tuple[str, str]],
+                           status_callback=None,
+                           concurrency: int = DEFAULT_CONCURRENCY,
+                           processes: Optional[int] = None,
+                           strict: bool = False) -> List[str]:
     """
     Find available domains from a list of domain combinations.
 
     Args:
-        domain_combinations: List of (domain, base) tuples
+        domain_combinations: Iterable of (domain, base) tuples
         status_callback: Optional callback function to report status
+        concurrency: Number of worker threads
+        processes: Number of worker processes; threads only if None
+        strict: Check cached "available" answers again instead of trusting them
 
     Returns:
-        List of available domain names
+        List of available domain names, in completion order
+    """
+    return list(iter_available_domains(domain_combinations, status_callback, concurrency,
+                                       processes, strict))
+
+
+def _bulk_registered(domains: List[str], api_key: str) -> Dict[str, bool]:
+    """
+    Check a batch of domains with one request to the WHOISXML bulk API.
+
+    Args:
+        domains: Domain names to check
+        api_key: WHOISXML API key
+
+    Returns:
+        Registration status keyed by domain; domains the API didn't
+        answer conclusively for, or the whole batch if the request
+        failed, are left out
+    """
+    body = json.dumps({"apiKey": api_key, "domainNames": domains, "outputFormat": "JSON"})
+    request = urllib.request.Request(BULK_API_URL, data=body.encode(),
+                                     headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            payload = json.load(response)
+    except (OSError, ValueError):  # URLError and HTTPError are OSErrors
+        return {}
+
+    entries = payload.get("DomainInfo", []) if isinstance(payload, dict) else payload
+    if isinstance(entries, dict):
+        entries = [entries]
+    if not isinstance(entries, list):
+        return {}
+    return {entry["domainName"].lower(): _BULK_AVAILABILITY[entry["domainAvailability"]]
+            for entry in entries
+            if isinstance(entry, dict) and isinstance(entry.get("domainName"), str)
+            and entry.get("domainAvailability") in _BULK_AVAILABILITY}
+
+
+def iter_available_domains_bulk(domain_combinations: Iterable[Tuple[str, str]],
+                                api_key: str,
+                                status_callback=None,
+                                batch_size: int = BULK_BATCH_SIZE,
+                                concurrency: int = DEFAULT_CONCURRENCY,
+                                strict: bool = False) -> Iterator[str]:
     """
-    available_domains = []
+    Yield available domains, checking them in batches with the WHOISXML API.
 
-    for domain, base in domain_combinations:
-        if status_callback:
-            status_callback(domain)
+    Domains with a fresh cache entry are not sent. Domains the API
+    doesn't answer for are checked with iter_available_domains on a
+    thread pool, so a failing API degrades to the threaded lookup rather
+    than a serial one.
 
-        if not check_domain(domain):
-            available_domains.append(domain)
+    Args:
+        domain_combinations: Iterable of (domain, base) tuples
+        api_key: WHOISXML API key
+        status_callback: Optional callback function to report status
+        batch_size: Domains per API request
+        concurrency: Number of worker threads for the fallback lookups
+        strict: Check cached "available" answers again instead of trusting them
 
-    return available_domains
+    Yields:
+        Available domain names; each batch's answered domains in input
+        order, then its fallbacks as they complete
+    """
+    combinations = iter(domain_combinations)
+    while batch := list(itertools.islice(combinations, batch_size)):
+        results = {domain: registered for domain, _ in batch
+                   if (registered := _cached_result(domain)) is not None
+                   and not (strict and registered is False)}
+        uncached = [domain for domain, _ in batch if domain not in results]
+        if uncached:
+            for domain, registered in _bulk_registered(uncached, api_key).items():
+                _store_result(domain, registered)
+                results[domain] = registered
+
+        for domain, _ in batch:
+            if domain not in results:
+                continue
+            if status_callback:
+                status_callback(domain)
+            if not results[domain]:
+                yield domain
+
+        leftovers = [(domain, base) for domain, base in batch if domain not in results]
+        if leftovers:
+            yield from iter_available_domains(leftovers, status_callback, concurrency,
+                                              strict=strict)
+
+
+class ResolverPool:
+    """
+    Round-robin over asynchronous DNS resolvers, one per nameserver.
+
+    A resolver that fails `threshold` lookups in a row is skipped for
+    `sentence_ms` milliseconds, so throughput scales with the number of
+    healthy resolvers instead of stalling on a throttled one. Must be
+    created inside a running event loop and closed with `async with`.
+    """
+
+    def __init__(self, nameservers: Optional[List[str]] = None,
+                 threshold: int = DEFAULT_PURGATORY_THRESHOLD,
+                 sentence_ms: int = DEFAULT_PURGATORY_SENTENCE_MS):
+        if nameservers:
+            self._resolvers = [aiodns.DNSResolver(nameservers=[nameserver], timeout=2, tries=1)
+                               for nameserver in nameservers]
+        else:
+            self._resolvers = [aiodns.DNSResolver(timeout=2, tries=1)]
+        self._threshold = threshold
+        self._sentence = sentence_ms / 1000
+        self._failures = [0] * len(self._resolvers)
+        self._benched_until = [0.0] * len(self._resolvers)
+        self._order = itertools.cycle(range(len(self._resolvers)))
+
+    async def __aenter__(self) -> "ResolverPool":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        for resolver in self._resolvers:
+            await resolver.close()
+
+    def acquire(self) -> Tuple[int, aiodns.DNSResolver]:
+        """
+        Pick the next resolver that is not in purgatory.
+
+        Returns:
+            Tuple of (resolver index, resolver); if every resolver is
+            benched, the one released soonest
+        """
+        now = time.monotonic()
+        for _ in range(len(self._resolvers)):
+            index = next(self._order)
+            if self._benched_until[index] <= now:
+                return index, self._resolvers[index]
+        index = min(range(len(self._resolvers)), key=self._benched_until.__getitem__)
+        return index, self._resolvers[index]
+
+    def report(self, index: int, failed: bool) -> None:
+        """
+        Record the outcome of a lookup made with a resolver.
+
+        Args:
+            index: Resolver index returned by acquire
+            failed: Whether the resolver failed to answer
+        """
+        if not failed:
+            self._failures[index] = 0
+            return
+        self._failures[index] += 1
+        if self._failures[index] >= self._threshold:
+            self._failures[index] = 0
+            self._benched_until[index] = time.monotonic() + self._sentence
+
+
+async def _dns_registered_async(resolvers: ResolverPool, domain: str) -> Optional[bool]:
+    """
+    Check if a domain is registered from its NS records alone.
+
+    Args:
+        resolvers: Pool of resolvers to query
+        domain: Domain name to check
+
+    Returns:
+        True if the domain has nameservers, False if it does not exist,
+        None if the lookup was inconclusive
+    """
+    index, resolver = resolvers.acquire()
+    try:
+        await resolver.query_dns(domain, 'NS')
+        resolvers.report(index, failed=False)
+        return True
+    except aiodns.error.DNSError as e:
+        code = e.args[0] if e.args else None
+        if code == aiodns.error.ARES_ENOTFOUND:
+            resolvers.report(index, failed=False)
+            return False
+        resolvers.report(index, failed=code in _RESOLVER_FAILURES)
+        return None
+    except UnicodeError:
+        return None  # aiodns couldn't encode the name; not the resolver's fault
+
+
+def create_rdap_session() -> aiohttp.ClientSession:
+    """
+    Create an HTTP session pooled for RDAP lookups.
+
+    Connections are kept alive and shared across lookups, so after the
+    first request to an RDAP server the TCP and TLS handshakes are
+    skipped. Must be called inside a running event loop.
+
+    Returns:
+        New client session; the caller closes it
+    """
+    connector = aiohttp.TCPConnector(limit=RDAP_CONNECTION_LIMIT,
+                                     limit_per_host=RDAP_CONNECTION_LIMIT_PER_HOST,
+                                     ttl_dns_cache=RDAP_DNS_CACHE_TTL)
+    return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=10))
+
+
+class RdapClient:
+    """
+    RDAP domain lookups over one shared HTTP session.
+
+    The IANA bootstrap file mapping TLDs to RDAP servers is fetched once,
+    on first use, and reused for every lookup. Without a session, one is
+    created with create_rdap_session and closed along with the client.
+    Must be created inside a running event loop and closed with
+    `async with`.
+    """
+
+    def __init__(self, bootstrap_url: str = RDAP_BOOTSTRAP_URL,
+                 session: Optional[aiohttp.ClientSession] = None):
+        self._bootstrap_url = bootstrap_url
+        self._owns_session = session is None
+        self._session = create_rdap_session() if session is None else session
+        self._servers: Optional[dict] = None
+        self._bootstrap_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "RdapClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._owns_session:
+            await self._session.close()
+
+    async def _server_for(self, tld: str) -> Optional[str]:
+        """
+        Find the RDAP base URL for a TLD, loading the bootstrap if needed.
+
+        Args:
+            tld: Top-level domain
+
+        Returns:
+            Base URL ending in a slash, or None if the TLD has no RDAP server
+        """
+        async with self._bootstrap_lock:
+            if self._servers is None:
+                self._servers = {}
+                try:
+                    async with self._session.get(self._bootstrap_url) as response:
+                        bootstrap = await response.json(content_type=None)
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                    return None  # Leave RDAP disabled for this run
+                for tlds, urls in bootstrap.get('services', []):
+                    url = next((u for u in urls if u.startswith('https://')), urls[0])
+                    for service_tld in tlds:
+                        self._servers[service_tld.lower()] = url.rstrip('/') + '/'
+        return self._servers.get(tld.lower())
+
+    async def registered(self, domain: str) -> Optional[bool]:
+        """
+        Check if a domain is registered with its registry's RDAP server.
+
+        Args:
+            domain: Domain name to check
+
+        Returns:
+            True if the registry has the domain, False if it reports it
+            not found, None if RDAP is unavailable or inconclusive
+        """
+        server = await self._server_for(domain.rsplit('.', 1)[-1])
+        if server is None:
+            return None
+        try:
+            async with self._session.get(f"{server}domain/{domain}") as response:
+                if response.status == 200:
+                    return True
+                if response.status == 404:
+                    return False
+                return None  # Rate limited or otherwise refused
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+
+
+async def iter_available_domains_async(domain_combinations: Iterable[Tuple[str, str]],
+                                       status_callback=None,
+                                       concurrency: int = DEFAULT_CONCURRENCY,
+                                       strict: bool = False,
+                                       nameservers: Optional[List[str]] = None,
+                                       purgatory_threshold: int = DEFAULT_PURGATORY_THRESHOLD,
+                                       purgatory_sentence_ms: int = DEFAULT_PURGATORY_SENTENCE_MS,
+                                       bloom_filters: Optional[Dict[str, BloomFilter]] = None,
+                                       session: Optional[aiohttp.ClientSession] = None
+                                       ) -> AsyncIterator[str]:
+    """
+    Yield available domains, checking all combinations concurrently.
+
+    Each domain is first checked against its TLD's zone Bloom filter, if
+    one is given, then with an asynchronous NS query; absence from the
+    zone and NXDOMAIN are taken as available. Inconclusive lookups, and
+    every lookup in strict mode, are asked of the registry over RDAP, and
+    failing that over WHOIS on a worker thread so the blocking sockets
+    overlap. Conclusive answers are cached; in strict mode a cached
+    "available" is confirmed again. A semaphore bounds how many lookups
+    are in flight at once, and input is read only as tasks finish. NS
+    queries rotate across the given nameservers, benching any that keep
+    failing.
+
+    Args:
+        domain_combinations: Iterable of (domain, base) tuples
+        status_callback: Optional callback function to report status
+        concurrency: Maximum number of lookups in flight at once
+        strict: Confirm every domain with the registry instead of trusting NXDOMAIN
+        nameservers: Resolver addresses to rotate across; the system
+            resolver if empty
+        purgatory_threshold: Consecutive failures before a resolver is benched
+        purgatory_sentence_ms: How long a benched resolver is skipped
+        bloom_filters: Zone Bloom filters keyed by canonical TLD, as
+            returned by load_bloom_filters
+        session: HTTP session for RDAP lookups, to share one across
+            batches; a pooled session for this batch if None
+
+    Yields:
+        Available domain names, in completion order
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    bloom_filters = bloom_filters or {}
+
+    async with ResolverPool(nameservers, purgatory_threshold, purgatory_sentence_ms) as resolvers, \
+            RdapClient(session=session) as rdap:
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+
+        async def check(domain: str) -> Tuple[str, bool]:
+            async with semaphore:
+                registered = _cached_result(domain)
+                if strict and registered is False:
+                    registered = None  # May have come from NXDOMAIN; confirm it
+                if registered is None and not strict:
+                    bloom = bloom_filters.get(domain.split('.', 1)[-1])
+                    if bloom is not None and domain not in bloom:
+                        registered = False  # Not in the zone: no delegation
+                    else:
+                        registered = await _dns_registered_async(resolvers, domain)
+                    if registered is not None:
+                        _store_result(domain, registered)
+                if registered is None:
+                    registered = await rdap.registered(domain)
+                    if registered is not None:
+                        _store_result(domain, registered)
+                if registered is None:
+                    registered = await loop.run_in_executor(executor, _check_whois, domain)
+            if status_callback:
+                status_callback(domain)
+            return domain, registered
+
+        domains = (domain for domain, _ in domain_combinations)
+        tasks = set()
+        try:
+            tasks.update(asyncio.create_task(check(domain)) for domain in
+                         itertools.islice(domains, concurrency * IN_FLIGHT_PER_WORKER))
+            while tasks:
+                finished, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    for next_domain in itertools.islice(domains, 1):
+                        tasks.add(asyncio.create_task(check(next_domain)))
+                    domain, registered = task.result()
+                    if not registered:
+                        yield domain
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Don't block the event loop on WHOIS sockets still open if
+            # iteration stopped early; their answers would be discarded
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def find_available_domains_async(domain_combinations: Iterable[Tuple[str, str]],
+                                       *args, **kwargs) -> List[str]:
+    """
+    Find available domains, checking all combinations concurrently.
+
+    Accepts the same arguments as iter_available_domains_async.
+
+    Args:
+        domain_combinations: Iterable of (domain, base) tuples
+
+    Returns:
+        List of available domain names, in input order
+    """
+    domain_combinations = list(domain_combinations)
+    available = {domain async for domain in
+                 iter_available_domains_async(domain_combinations, *args, **kwargs)}
+    return [domain for domain, _ in domain_combinations if domain in available]
+
+
+def _write(line: bytes, flush: bool = False) -> None:
+    """
+    Queue a line for stdout, writing the buffer out once it fills.
+
+    Args:
+        line: Encoded line, without the trailing newline
+        flush: Write the buffer out now
+    """
+    _output.extend(line)
+    _output.extend(b"\n")
+    if flush or len(_output) >= OUTPUT_BUFFER_SIZE:
+        flush_output()
+
+
+def flush_output() -> None:
+    """
+    Write any buffered output to stdout.
+    """
+    if not _output:
+        return
+    sys.stdout.flush()  # Keep ordering with anything print() has queued
+    stream = getattr(sys.stdout, 'buffer', None)
+    if stream is None:
+        sys.stdout.write(_output.decode())
+        sys.stdout.flush()
+    else:
+        stream.write(_output)
+        stream.flush()
+    _output.clear()
 
 
 def print_status(base: str) -> None:
     """
     Print status update for the current base string being checked.
 
+    Output is buffered; call flush_output to write it immediately.
+
     Args:
         base: The base string currently being checked
     """
-    print(f"Checking: {base}")
+    _write(b"Checking: " + base.encode())
 
 
-def print_results(available_domains: List[str]) -> None:
+def print_results(available_domains: Iterable[str]) -> None:
     """
-    Print the list of available domains.
+    Print available domains as they arrive.
 
     Args:
-        available_domains: List of available domain names
+        available_domains: Iterable of available domain names
     """
-    if available_domains:
-        print("Available domains:")
-        print("\n".join(available_domains))
-    else:
-        print("No available domains found.")
+    found = False
+    for domain in available_domains:
+        if not found:
+            _write(b"Available domains:")
+            found = True
+        _write(domain.encode(), flush=True)
+
+    if not found:
+        _write(b"No available domains found.")
+    flush_output()
+
+
+async def print_results_async(available_domains: AsyncIterable[str]) -> None:
+    """
+    Print available domains as they arrive from an async iterable.
+
+    Args:
+        available_domains: Async iterable of available domain names
+    """
+    found = False
+    async for domain in available_domains:
+        if not found:
+            _write(b"Available domains:")
+            found = True
+        _write(domain.encode(), flush=True)
+
+    if not found:
+        _write(b"No available domains found.")
+    flush_output()
+
+
+def _positive_int(value: str) -> int:
+    """
+    Parse a command line value that must be a positive integer.
+
+    Args:
+        value: Value as given on the command line
+
+    Returns:
+        The parsed integer
+
+    Raises:
+        argparse.ArgumentTypeError: If the value isn't a positive integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value!r}")
+    return number
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -136,7 +1292,50 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument('input_file', help='File containing list of base strings')
     parser.add_argument('--config', default="config.yaml",
                         help='Configuration file path (default: config.yaml)')
-    return parser.parse_args()
+    parser.add_argument('--concurrency', type=_positive_int, default=DEFAULT_CONCURRENCY,
+                        help='Maximum WHOIS lookups in flight at once; going beyond ~50 '
+                             f'risks WHOIS server rate limits (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--strict', action='store_true',
+                        help='Confirm every domain with the registry (RDAP or WHOIS) '
+                             'instead of trusting NXDOMAIN')
+    parser.add_argument('--purgatory-threshold', type=int, default=DEFAULT_PURGATORY_THRESHOLD,
+                        help='Consecutive failures before a DNS resolver is benched '
+                             f'(default: {DEFAULT_PURGATORY_THRESHOLD})')
+    parser.add_argument('--purgatory-sentence-ms', type=int, default=DEFAULT_PURGATORY_SENTENCE_MS,
+                        help='Milliseconds a benched DNS resolver is skipped '
+                             f'(default: {DEFAULT_PURGATORY_SENTENCE_MS})')
+    parser.add_argument('--bloom-dir',
+                        help='Directory of <tld>.bloom zone filters; domains absent from '
+                             'their TLD\'s filter are reported available without a lookup')
+    parser.add_argument('--bulk-api-key',
+                        help='WHOISXML API key; checks domains in batches of '
+                             f'{BULK_BATCH_SIZE} with its bulk availability API, falling back '
+                             'to --concurrency threads for domains it doesn\'t answer; '
+                             'DNS uses the system resolver')
+    parser.add_argument('--procs', type=_positive_int,
+                        help='Check with this many worker processes (each running threads) '
+                             'instead of the async event loop; spreads the per-lookup overhead '
+                             'when one interpreter can\'t keep up; DNS uses the system resolver')
+    parser.add_argument('--quiet', action='store_true',
+                        help="Don't print a status line for each domain checked")
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Skip the on-disk lookup cache ({DEFAULT_CACHE_FILE})')
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_CACHE_TTL,
+                        help=f'Seconds a cached lookup stays valid (default: {DEFAULT_CACHE_TTL})')
+    args = parser.parse_args()
+
+    # The bulk and --procs engines check domains with check_domain, which
+    # neither consults Bloom filters nor rotates resolvers
+    engine = '--bulk-api-key' if args.bulk_api_key else '--procs' if args.procs else None
+    if args.bulk_api_key and args.procs:
+        parser.error("--procs can't be combined with --bulk-api-key")
+    if engine and args.bloom_dir:
+        parser.error(f"--bloom-dir isn't supported with {engine}")
+    if engine and (args.purgatory_threshold != DEFAULT_PURGATORY_THRESHOLD
+                   or args.purgatory_sentence_ms != DEFAULT_PURGATORY_SENTENCE_MS):
+        parser.error(f"--purgatory-threshold and --purgatory-sentence-ms aren't supported "
+                     f"with {engine}")
+    return args
 
 
 def main() -> None:
@@ -145,16 +1344,38 @@ def main() -> None:
     """
     args = parse_arguments()
 
-    # Load configuration and input
-    tlds = load_config(args.config)
-    base_strings = load_strings(args.input_file)
+    if not args.no_cache:
+        open_cache(ttl=args.cache_ttl)
 
-    # Generate combinations and find available domains
-    domain_combinations = generate_domain_combinations(base_strings, tlds)
-    available_domains = find_available_domains(domain_combinations, print_status)
+    try:
+        # Load configuration and input
+        tlds = load_config(args.config)
+        nameservers = load_resolvers(args.config)
+        if nameservers and (args.bulk_api_key or args.procs):
+            logger.warning("Ignoring the resolvers in %s; only the async engine rotates them",
+                           args.config)
+        base_strings = load_strings(args.input_file)
+        bloom_filters = load_bloom_filters(args.bloom_dir, tlds) if args.bloom_dir else {}
 
-    # Output results
-    print_results(available_domains)
+        # Generate combinations and print available domains as they are found
+        domain_combinations = generate_domain_combinations(base_strings, tlds)
+        status_callback = None if args.quiet else print_status
+        if args.bulk_api_key:
+            print_results(iter_available_domains_bulk(domain_combinations, args.bulk_api_key,
+                                                      status_callback,
+                                                      concurrency=args.concurrency,
+                                                      strict=args.strict))
+        elif args.procs:
+            print_results(iter_available_domains(domain_combinations, status_callback,
+                                                 args.concurrency, args.procs, args.strict))
+        else:
+            asyncio.run(print_results_async(
+                iter_available_domains_async(domain_combinations, status_callback,
+                                             args.concurrency, args.strict, nameservers,
+                                             args.purgatory_threshold, args.purgatory_sentence_ms,
+                                             bloom_filters)))
+    finally:
+        close_cache()
 
 
 if __name__ == "__main__":
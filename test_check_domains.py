@@ -6,14 +6,23 @@ domain availability checker, using pytest fixtures and mocks
 to isolate units and avoid actual network calls.
 """
 
+import asyncio
+import json
 import pytest
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import patch, mock_open, AsyncMock, MagicMock
 import os
 import tempfile
+import time
 import yaml
+import dns.resolver
+import aiodns.error
 import check_domains
 
 
+REGISTERED_WHOIS = b"   Domain Name: EXAMPLE.COM\r\n   Registrar: RESERVED-Internet Assigned Numbers Authority\r\n"
+NOT_FOUND_WHOIS = b'No match for "NONEXISTENT-DOMAIN-12345.COM".\r\n'
+
+
 @pytest.fixture
 def sample_config():
     """Fixture providing sample configuration data."""
@@ -36,6 +45,32 @@ def sample_input():
     """
 
 
+@pytest.fixture
+def async_dns():
+    """Fixture replacing the async resolver; set `query_dns.side_effect` per test."""
+    resolver = MagicMock()
+    resolver.query_dns = AsyncMock()
+    resolver.close = AsyncMock()
+    with patch("aiodns.DNSResolver", return_value=resolver):
+        yield resolver
+
+
+@pytest.fixture
+def no_rdap():
+    """Fixture making every RDAP lookup inconclusive."""
+    with patch("check_domains.RdapClient.registered", new_callable=AsyncMock,
+               return_value=None) as mock_registered:
+        yield mock_registered
+
+
+@pytest.fixture
+def no_dns():
+    """Fixture making every DNS lookup come back NXDOMAIN."""
+    with patch.object(check_domains._resolver, "resolve",
+                      side_effect=dns.resolver.NXDOMAIN) as mock_resolve:
+        yield mock_resolve
+
+
 def test_load_config_with_valid_file(sample_config):
     """Test loading config from a valid YAML file."""
     with patch("builtins.open", mock_open(read_data=sample_config)):
@@ -53,11 +88,32 @@ def test_load_config_with_missing_file():
 def test_load_config_with_invalid_yaml():
     """Test loading config with invalid YAML content."""
     with patch("builtins.open", mock_open(read_data="invalid: yaml: content:")):
-        with patch("yaml.safe_load", side_effect=yaml.YAMLError):
+        with patch("yaml.load", side_effect=yaml.YAMLError):
             with pytest.raises(yaml.YAMLError):
                 check_domains.load_config("invalid.yaml")
 
 
+def test_load_resolvers_with_valid_file():
+    """Test loading resolver addresses from a valid YAML file."""
+    config = "top_level_domains:\n  - com\nresolvers:\n  - 1.1.1.1\n  - 8.8.8.8\n"
+    with patch("builtins.open", mock_open(read_data=config)):
+        result = check_domains.load_resolvers("dummy_path.yaml")
+        assert result == ["1.1.1.1", "8.8.8.8"]
+
+
+def test_load_resolvers_without_resolvers(sample_config):
+    """Test loading resolvers from a config that doesn't list any."""
+    with patch("builtins.open", mock_open(read_data=sample_config)):
+        assert check_domains.load_resolvers("dummy_path.yaml") == []
+
+
+def test_load_config_uses_safe_loader():
+    """Test that config files can't construct arbitrary Python objects."""
+    with patch("builtins.open", mock_open(read_data="top_level_domains: !!python/object:os.system {}")):
+        with pytest.raises(yaml.YAMLError):
+            check_domains.load_config("unsafe.yaml")
+
+
 def test_load_strings_with_valid_file(sample_input):
     """Test loading strings from a valid input file."""
     with patch("builtins.open", mock_open(read_data=sample_input)):
@@ -72,18 +128,214 @@ def test_load_strings_with_missing_file():
         assert result == []
 
 
-def test_check_domain_registered():
+def test_check_domain_registered(no_dns):
     """Test checking a registered domain."""
-    with patch("whois.whois", return_value=MagicMock()):
+    with patch("check_domains._whois_query", return_value=REGISTERED_WHOIS):
         assert check_domains.check_domain("example.com") is True
 
 
-def test_check_domain_unregistered():
+def test_check_domain_unregistered(no_dns):
     """Test checking an unregistered domain."""
-    with patch("whois.whois", side_effect=Exception("Domain not found")):
+    with patch("check_domains._whois_query", return_value=NOT_FOUND_WHOIS):
         assert check_domains.check_domain("nonexistent-domain-12345.com") is False
 
 
+@pytest.mark.parametrize("domain, response", [
+    ("nonexistent.com", b'No match for "NONEXISTENT.COM".'),
+    ("nonexistent.xyz", b"The queried object does not exist: DOMAIN NOT FOUND"),
+    ("nonexistent.io", b"NOT FOUND\r\nnonexistent.io is available for purchase"),
+    ("nonexistent.social", b"Domain Status: AVAILABLE"),
+    ("nonexistent.community", b"%% No entries found for the selected source(s)."),
+])
+def test_check_domain_not_found_responses(no_dns, domain, response):
+    """Test recognizing registries' various "not found" answers."""
+    with patch("check_domains._whois_query", return_value=response):
+        assert check_domains.check_domain(domain) is False
+
+
+def test_check_domain_uses_registry_markers(no_dns):
+    """Test that a registry's own marker is required for its TLDs."""
+    response = b"Domain Name: NOTFOUND-BAND.COM\r\nRegistrar: Example Registrar\r\n"
+    with patch("check_domains._whois_query", return_value=response):
+        assert check_domains.check_domain("notfound-band.com") is True
+
+
+def test_check_domain_empty_response_is_retried(no_dns):
+    """Test that an empty WHOIS response is treated as a transient failure."""
+    with patch("check_domains._whois_query", side_effect=[b"", REGISTERED_WHOIS]), \
+         patch("time.sleep"):
+        assert check_domains.check_domain("example.com") is True
+
+
+def test_check_domain_without_whois_server(tmp_path, no_dns):
+    """Test that a TLD without a WHOIS server is assumed registered, and not cached."""
+    check_domains.open_cache(str(tmp_path / "cache"))
+    try:
+        with patch("check_domains._whois_query", side_effect=LookupError("No WHOIS server")):
+            assert check_domains.check_domain("test.invalid") is True
+            assert check_domains._cached_result("test.invalid") is None
+    finally:
+        check_domains.close_cache()
+
+
+def test_whois_request_reads_until_closed():
+    """Test sending a WHOIS query and reading the response until EOF."""
+    sock = MagicMock()
+    sock.__enter__.return_value = sock
+    sock.recv.side_effect = [b"Domain Name: ", b"EXAMPLE.COM\r\n", b""]
+
+    with patch("socket.create_connection", return_value=sock) as mock_connect:
+        response = check_domains._whois_request("whois.verisign-grs.com", "example.com")
+
+    assert response == b"Domain Name: EXAMPLE.COM\r\n"
+    mock_connect.assert_called_once_with(("whois.verisign-grs.com", 43),
+                                         timeout=check_domains.WHOIS_TIMEOUT)
+    sock.sendall.assert_called_once_with(b"example.com\r\n")
+
+
+def test_whois_query_uses_known_server():
+    """Test that TLDs in the server map are queried without asking IANA."""
+    with patch("check_domains._whois_request", return_value=REGISTERED_WHOIS) as mock_request:
+        assert check_domains._whois_query("example.com") == REGISTERED_WHOIS
+        mock_request.assert_called_once_with("whois.verisign-grs.com", "example.com")
+
+
+def test_whois_query_asks_iana_once_per_tld():
+    """Test that other TLDs' servers are looked up at IANA once and reused."""
+    iana = b"domain:       SOCIAL\r\n\r\nwhois:        whois.nic.social\r\n"
+
+    with patch.dict(check_domains._whois_servers, clear=True), \
+         patch("check_domains._whois_request",
+               side_effect=[iana, REGISTERED_WHOIS, REGISTERED_WHOIS]) as mock_request:
+        check_domains._whois_query("test.social")
+        check_domains._whois_query("example.social")
+
+    assert [c.args for c in mock_request.call_args_list] == [
+        ("whois.iana.org", "social"),
+        ("whois.nic.social", "test.social"),
+        ("whois.nic.social", "example.social"),
+    ]
+
+
+def test_whois_query_without_server():
+    """Test querying a TLD that has no WHOIS server."""
+    with patch.dict(check_domains._whois_servers, clear=True), \
+         patch("check_domains._whois_request", return_value=b"domain:       INVALID\r\n"):
+        with pytest.raises(LookupError):
+            check_domains._whois_query("test.invalid")
+
+
+def test_check_domain_retries_transient_errors(no_dns):
+    """Test that transient WHOIS failures are retried with backoff."""
+    with patch("check_domains._whois_query",
+               side_effect=[TimeoutError(), b"Query rate limit exceeded\r\n", NOT_FOUND_WHOIS]) as mock_whois, \
+         patch("time.sleep") as mock_sleep:
+        assert check_domains.check_domain("nonexistent-domain-12345.com") is False
+        assert mock_whois.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.2, 0.4]
+
+
+def test_check_domain_assumes_registered_on_repeated_failure(tmp_path, no_dns):
+    """Test that a domain is assumed registered, and not cached, if WHOIS keeps failing."""
+    check_domains.open_cache(str(tmp_path / "cache"))
+    try:
+        with patch("check_domains._whois_query", side_effect=ConnectionRefusedError()) as mock_whois, \
+             patch("time.sleep"):
+            assert check_domains.check_domain("example.com") is True
+            assert mock_whois.call_count == check_domains.WHOIS_ATTEMPTS
+            assert check_domains._cached_result("example.com") is None
+    finally:
+        check_domains.close_cache()
+
+
+def test_check_domain_with_nameservers_skips_whois():
+    """Test that a domain with NS records is registered without a WHOIS query."""
+    with patch.object(check_domains._resolver, "resolve", return_value=MagicMock()), \
+         patch("check_domains._whois_query") as mock_whois:
+        assert check_domains.check_domain("example.com") is True
+        mock_whois.assert_not_called()
+
+
+def test_check_domain_dns_timeout_falls_back_to_whois():
+    """Test that an inconclusive DNS lookup falls back to WHOIS."""
+    with patch.object(check_domains._resolver, "resolve",
+                      side_effect=dns.resolver.LifetimeTimeout(timeout=2, errors=[])), \
+         patch("check_domains._whois_query", return_value=NOT_FOUND_WHOIS) as mock_whois:
+        assert check_domains.check_domain("nonexistent-domain-12345.com") is False
+        mock_whois.assert_called_once()
+
+
+def test_check_domain_uses_cache(tmp_path, no_dns):
+    """Test that repeated checks are served from the on-disk cache."""
+    check_domains.open_cache(str(tmp_path / "cache"))
+    try:
+        with patch("check_domains._whois_query", return_value=REGISTERED_WHOIS) as mock_whois:
+            assert check_domains.check_domain("example.com") is True
+            assert check_domains.check_domain("example.com") is True
+            mock_whois.assert_called_once()
+    finally:
+        check_domains.close_cache()
+
+
+def test_check_domain_cache_expires(tmp_path, no_dns):
+    """Test that expired cache entries trigger a fresh lookup."""
+    check_domains.open_cache(str(tmp_path / "cache"), ttl=60)
+    try:
+        with patch("check_domains._whois_query", return_value=NOT_FOUND_WHOIS) as mock_whois, \
+             patch("time.time", side_effect=[1000, 1061, 1061]):
+            assert check_domains.check_domain("example.com") is False
+            assert check_domains.check_domain("example.com") is False
+            assert mock_whois.call_count == 2
+    finally:
+        check_domains.close_cache()
+
+
+def test_bloom_filter_membership(tmp_path):
+    """Test Bloom filter membership survives a save and load round trip."""
+    bloom = check_domains.BloomFilter(capacity=100)
+    for name in ["example.com", "test.com"]:
+        bloom.add(name)
+
+    path = str(tmp_path / "com.bloom")
+    bloom.save(path)
+    loaded = check_domains.BloomFilter.load(path)
+
+    assert "example.com" in loaded
+    assert "test.com" in loaded
+    assert sum(f"free{i}.com" in loaded for i in range(1000)) < 20
+
+
+def test_bloom_filter_load_rejects_other_files(tmp_path):
+    """Test loading a file that isn't a saved Bloom filter."""
+    path = tmp_path / "com.bloom"
+    path.write_bytes(b"not a bloom filter at all")
+    with pytest.raises(ValueError):
+        check_domains.BloomFilter.load(str(path))
+
+
+def test_build_bloom_filter_from_zone_file(tmp_path):
+    """Test building a filter from the registrable domains in a zone file."""
+    zone = tmp_path / "com.zone"
+    zone.write_text("$ORIGIN com.\n"
+                    "; comment\n"
+                    "com. 900 in soa a.gtld-servers.net. nstld.verisign-grs.com. 1 2 3 4 5\n"
+                    "example.com. 172800 in ns a.iana-servers.net.\n"
+                    "EXAMPLE.COM. 172800 in ns b.iana-servers.net.\n"
+                    "ns1.example.com. 172800 in a 192.0.2.1\n")
+
+    bloom = check_domains.build_bloom_filter(str(zone), "com")
+    assert "example.com" in bloom
+    assert "ns1.example.com" not in bloom
+
+
+def test_load_bloom_filters(tmp_path):
+    """Test loading filters only for TLDs that have a file."""
+    check_domains.BloomFilter(capacity=10).save(str(tmp_path / "com.bloom"))
+
+    result = check_domains.load_bloom_filters(str(tmp_path), ["COM", "net"])
+    assert list(result) == ["com"]
+
+
 def test_generate_domain_combinations():
     """Test generating domain combinations from base strings and TLDs."""
     bases = ["test", "example"]
@@ -100,6 +352,31 @@ def test_generate_domain_combinations():
     assert sorted(result) == sorted(expected)
 
 
+def test_generate_domain_combinations_grouped_by_tld():
+    """Test that combinations for the same TLD are generated consecutively."""
+    result = check_domains.generate_domain_combinations(["a", "b", "c"], ["com", "net"])
+    assert [domain for domain, _ in result] == ["a.com", "b.com", "c.com", "a.net", "b.net", "c.net"]
+
+
+def test_generate_domain_combinations_deduplicates(caplog):
+    """Test that inputs are canonicalized and duplicates dropped before combining."""
+    bases = ["Test", "test ", "bücher", "example", "", "ü" * 64, "naïve..x"]
+    tlds = ["com", ".COM", "net"]
+
+    expected = [
+        ("test.com", "test"),
+        ("xn--bcher-kva.com", "xn--bcher-kva"),
+        ("example.com", "example"),
+        ("test.net", "test"),
+        ("xn--bcher-kva.net", "xn--bcher-kva"),
+        ("example.net", "example")
+    ]
+
+    result = check_domains.generate_domain_combinations(bases, tlds)
+    assert list(result) == expected
+    assert "Dropped 5 duplicate, empty or invalid" in caplog.text
+
+
 def test_find_available_domains():
     """Test finding available domains with a mock domain checker."""
     domains = [
@@ -110,18 +387,439 @@ def test_find_available_domains():
 
     # Mock check_domain to return False only for test.net (making it available)
     with patch("check_domains.check_domain",
-               side_effect=lambda domain: False if domain == "test.net" else True):
+               side_effect=lambda domain, strict: False if domain == "test.net" else True):
         result = check_domains.find_available_domains(domains)
         assert result == ["test.net"]
 
 
+def test_iter_available_domains_yields_as_completed():
+    """Test that available domains are yielded lazily by the generator."""
+    domains = [("test.com", "test"), ("test.net", "test")]
+
+    with patch("check_domains.check_domain",
+               side_effect=lambda domain, strict: domain == "test.com"):
+        iterator = check_domains.iter_available_domains(domains)
+        assert next(iterator) == "test.net"
+        assert list(iterator) == []
+
+
+def test_iter_available_domains_reads_input_lazily():
+    """Test that only a bounded window of lookups is queued ahead of the results."""
+    read = []
+
+    def domains():
+        for i in range(100):
+            read.append(i)
+            yield f"test{i}.com", f"test{i}"
+
+    with patch("check_domains.check_domain", return_value=False):
+        iterator = check_domains.iter_available_domains(domains(), concurrency=2)
+        next(iterator)
+        assert len(read) <= 2 * check_domains.IN_FLIGHT_PER_WORKER + 1
+        assert len(list(iterator)) == 99
+
+
+def test_find_available_domains_with_processes(tmp_path):
+    """Test checking domains on worker processes, with the parent owning the cache."""
+    domains = [(f"test{i}.com", f"test{i}") for i in range(40)] + [("cached.com", "cached")]
+    checked = []
+
+    check_domains.open_cache(str(tmp_path / "cache"))
+    try:
+        check_domains._store_result("cached.com", False)
+        with patch("check_domains._lookup",
+                   side_effect=lambda domain: None if domain == "test0.com" else domain == "test1.com"):
+            result = check_domains.find_available_domains(domains, checked.append,
+                                                          concurrency=4, processes=2)
+
+        assert sorted(result) == sorted(["cached.com"] + [f"test{i}.com" for i in range(2, 40)])
+        assert sorted(checked) == sorted(domain for domain, _ in domains)
+        assert check_domains._cached_result("test1.com") is True
+        assert check_domains._cached_result("test0.com") is None
+    finally:
+        check_domains.close_cache()
+
+
+def test_find_available_domains_with_processes_strict(tmp_path):
+    """Test that strict mode confirms a cached "available" on worker processes."""
+    domains = [("cached.com", "cached"), ("taken.com", "taken")]
+
+    check_domains.open_cache(str(tmp_path / "cache"))
+    try:
+        check_domains._store_result("cached.com", False)
+        check_domains._store_result("taken.com", True)
+        with patch("check_domains._lookup", return_value=True):
+            result = check_domains.find_available_domains(domains, concurrency=2, processes=2,
+                                                          strict=True)
+
+        assert result == []
+        assert check_domains._cached_result("cached.com") is True
+    finally:
+        check_domains.close_cache()
+
+
+def test_find_available_domains_reports_status():
+    """Test that every domain is reported once as its lookup completes."""
+    domains = [("test.com", "test"), ("test.net", "test"), ("example.com", "example")]
+    checked = []
+
+    with patch("check_domains.check_domain", return_value=False):
+        result = check_domains.find_available_domains(domains, checked.append, concurrency=2)
+
+    assert sorted(result) == ["example.com", "test.com", "test.net"]
+    assert sorted(checked) == sorted(result)
+
+
+def test_find_available_domains_async(async_dns, no_rdap):
+    """Test finding available domains concurrently, preserving input order."""
+    domains = [
+        ("test.com", "test"),
+        ("test.net", "test"),
+        ("example.com", "example"),
+        ("example.net", "example")
+    ]
+    checked = []
+
+    with patch("check_domains._whois_registered",
+               side_effect=lambda domain: domain not in ("test.net", "example.net")):
+        result = asyncio.run(
+            check_domains.find_available_domains_async(domains, checked.append, concurrency=2,
+                                                       strict=True))
+
+    assert result == ["test.net", "example.net"]
+    assert sorted(checked) == sorted(domain for domain, _ in domains)
+    async_dns.query_dns.assert_not_called()
+
+
+def test_find_available_domains_async_uses_dns(async_dns, no_rdap):
+    """Test that NS answers and NXDOMAIN settle domains without WHOIS."""
+    domains = [("test.com", "test"), ("test.net", "test"), ("example.com", "example")]
+
+    def query_dns(domain, qtype):
+        if domain == "test.com":
+            return MagicMock()
+        if domain == "test.net":
+            raise aiodns.error.DNSError(aiodns.error.ARES_ENOTFOUND, "Domain name not found")
+        raise aiodns.error.DNSError(aiodns.error.ARES_ETIMEOUT, "Timeout while contacting DNS servers")
+
+    async_dns.query_dns.side_effect = query_dns
+    with patch("check_domains._whois_registered", return_value=False) as mock_check, \
+         patch("check_domains._has_nameservers") as mock_sync_dns:
+        result = asyncio.run(check_domains.find_available_domains_async(domains))
+
+    assert result == ["test.net", "example.com"]
+    mock_check.assert_called_once_with("example.com")
+    mock_sync_dns.assert_not_called()
+    no_rdap.assert_called_once_with("example.com")
+
+
+def test_find_available_domains_async_uses_bloom_filter(async_dns, no_rdap):
+    """Test that domains absent from their zone filter skip every lookup."""
+    bloom = check_domains.BloomFilter(capacity=10)
+    bloom.add("test.com")
+    uk_bloom = check_domains.BloomFilter(capacity=10)
+    uk_bloom.add("test.co.uk")
+    domains = [("test.com", "test"), ("free.com", "free"), ("test.net", "test"),
+               ("test.co.uk", "test"), ("free.co.uk", "free")]
+    async_dns.query_dns.side_effect = lambda domain, qtype: MagicMock()
+
+    result = asyncio.run(check_domains.find_available_domains_async(
+        domains, bloom_filters={"com": bloom, "co.uk": uk_bloom}))
+
+    assert result == ["free.com", "free.co.uk"]
+    queried = sorted(c.args[0] for c in async_dns.query_dns.call_args_list)
+    assert queried == ["test.co.uk", "test.com", "test.net"]
+
+
+def test_find_available_domains_async_skips_invalid_names(async_dns, no_rdap):
+    """Test that bases that aren't valid IDNA never reach a lookup engine."""
+    async_dns.query_dns.side_effect = aiodns.error.DNSError(aiodns.error.ARES_ENOTFOUND,
+                                                            "Domain name not found")
+    domains = check_domains.generate_domain_combinations(["ü" * 64, "naïve..x", "example"],
+                                                         ["com"])
+
+    result = asyncio.run(check_domains.find_available_domains_async(domains))
+
+    assert result == ["example.com"]
+    queried = [c.args[0] for c in async_dns.query_dns.call_args_list]
+    assert queried == ["example.com"]
+
+
+def test_iter_available_domains_async_reads_input_lazily(async_dns):
+    """Test that tasks are created as earlier ones finish, not for the whole input up front."""
+    read = []
+
+    def domains():
+        for i in range(100):
+            read.append(i)
+            yield f"test{i}.com", f"test{i}"
+
+    async_dns.query_dns.side_effect = aiodns.error.DNSError(aiodns.error.ARES_ENOTFOUND,
+                                                            "Domain name not found")
+
+    async def run():
+        iterator = check_domains.iter_available_domains_async(domains(), concurrency=2)
+        await anext(iterator)
+        assert len(read) <= 2 * check_domains.IN_FLIGHT_PER_WORKER + 1
+        return 1 + len([domain async for domain in iterator])
+
+    assert asyncio.run(run()) == 100
+
+
+def test_iter_available_domains_async_early_exit_does_not_block(async_dns):
+    """Test that stopping iteration early doesn't wait on the WHOIS thread pool."""
+    domains = [(f"test{i}.com", f"test{i}") for i in range(10)]
+    async_dns.query_dns.side_effect = aiodns.error.DNSError(aiodns.error.ARES_ENOTFOUND,
+                                                            "Domain name not found")
+
+    async def run():
+        iterator = check_domains.iter_available_domains_async(domains, concurrency=2)
+        await anext(iterator)
+        await iterator.aclose()
+
+    with patch("check_domains.ThreadPoolExecutor") as mock_executor:
+        asyncio.run(run())
+
+    mock_executor.return_value.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+
+
+def test_find_available_domains_async_caches_dns_answers(tmp_path, async_dns, no_rdap):
+    """Test that NS answers and NXDOMAIN are cached and served on the next run."""
+    domains = [("test.com", "test"), ("test.net", "test")]
+
+    def query_dns(domain, qtype):
+        if domain == "test.com":
+            return MagicMock()
+        raise aiodns.error.DNSError(aiodns.error.ARES_ENOTFOUND, "Domain name not found")
+
+    async_dns.query_dns.side_effect = query_dns
+    check_domains.open_cache(str(tmp_path / "cache"))
+    try:
+        assert asyncio.run(check_domains.find_available_domains_async(domains)) == ["test.net"]
+        assert async_dns.query_dns.call_count == 2
+
+        assert asyncio.run(check_domains.find_available_domains_async(domains)) == ["test.net"]
+        assert async_dns.query_dns.call_count == 2
+
+        with patch("check_domains._whois_registered", return_value=True) as mock_check:
+            assert asyncio.run(check_domains.find_available_domains_async(domains, strict=True)) == []
+            mock_check.assert_called_once_with("test.net")
+    finally:
+        check_domains.close_cache()
+
+
+def test_find_available_domains_async_unknown_whois_is_registered(tmp_path, async_dns, no_rdap):
+    """Test that a WHOIS fallback that can't decide assumes registered and isn't cached."""
+    check_domains.open_cache(str(tmp_path / "cache"))
+    try:
+        with patch("check_domains._whois_registered", return_value=None):
+            result = asyncio.run(check_domains.find_available_domains_async(
+                [("test.xyz", "test")], strict=True))
+        assert result == []
+        assert check_domains._cached_result("test.xyz") is None
+    finally:
+        check_domains.close_cache()
+
+
+def test_find_available_domains_async_uses_rdap(async_dns):
+    """Test that RDAP answers settle domains before falling back to WHOIS."""
+    domains = [("test.com", "test"), ("test.net", "test"), ("test.xyz", "test")]
+    rdap_answers = {"test.com": True, "test.net": False, "test.xyz": None}
+
+    with patch("check_domains.RdapClient.registered", new_callable=AsyncMock,
+               side_effect=rdap_answers.get), \
+         patch("check_domains._whois_registered", return_value=False) as mock_check:
+        result = asyncio.run(check_domains.find_available_domains_async(domains, strict=True))
+
+    assert result == ["test.net", "test.xyz"]
+    mock_check.assert_called_once_with("test.xyz")
+
+
+def test_rdap_client_shares_given_session():
+    """Test that a caller's session is used for lookups and left open."""
+    async def lookup():
+        async with check_domains.create_rdap_session() as session:
+            async with check_domains.RdapClient(session=session) as rdap:
+                assert rdap._session is session
+            assert not session.closed
+            connector = session.connector
+            assert connector.limit == check_domains.RDAP_CONNECTION_LIMIT
+            assert connector.limit_per_host == check_domains.RDAP_CONNECTION_LIMIT_PER_HOST
+
+    asyncio.run(lookup())
+
+
+def test_rdap_client_uses_bootstrap():
+    """Test that the RDAP client resolves servers from the bootstrap once."""
+    bootstrap = {"services": [[["com", "net"], ["http://rdap.example/com/v1",
+                                                "https://rdap.example/com/v1"]]]}
+    statuses = {"https://rdap.example/com/v1/domain/taken.com": 200,
+                "https://rdap.example/com/v1/domain/free.net": 404}
+    requested = []
+
+    def get(url):
+        requested.append(url)
+        response = MagicMock(status=statuses.get(url, 200))
+        response.json = AsyncMock(return_value=bootstrap)
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=response)
+        context.__aexit__ = AsyncMock(return_value=False)
+        return context
+
+    async def lookup():
+        async with check_domains.RdapClient("https://bootstrap.example") as rdap:
+            with patch.object(rdap._session, "get", side_effect=get):
+                return [await rdap.registered("taken.com"),
+                        await rdap.registered("free.net"),
+                        await rdap.registered("other.org")]
+
+    assert asyncio.run(lookup()) == [True, False, None]
+    assert requested.count("https://bootstrap.example") == 1
+
+
+def test_resolver_pool_rotates_and_benches():
+    """Test that resolvers are used round-robin and benched after repeated failures."""
+    with patch("aiodns.DNSResolver", side_effect=lambda **kwargs: MagicMock()):
+        pool = check_domains.ResolverPool(["1.1.1.1", "8.8.8.8"], threshold=2, sentence_ms=1000)
+
+    assert [pool.acquire()[0] for _ in range(4)] == [0, 1, 0, 1]
+
+    pool.report(0, failed=True)
+    pool.report(0, failed=True)
+    assert [pool.acquire()[0] for _ in range(3)] == [1, 1, 1]
+
+    with patch("time.monotonic", return_value=time.monotonic() + 2):
+        assert {pool.acquire()[0] for _ in range(2)} == {0, 1}
+
+
+def test_resolver_pool_success_resets_failures():
+    """Test that a successful lookup resets a resolver's failure count."""
+    with patch("aiodns.DNSResolver", side_effect=lambda **kwargs: MagicMock()):
+        pool = check_domains.ResolverPool(["1.1.1.1", "8.8.8.8"], threshold=2, sentence_ms=1000)
+
+    pool.report(0, failed=True)
+    pool.report(0, failed=False)
+    pool.report(0, failed=True)
+    assert [pool.acquire()[0] for _ in range(2)] == [0, 1]
+
+
+def test_dns_registered_async_unencodable_name():
+    """Test that a name aiodns can't encode is inconclusive, not a resolver failure."""
+    async def lookup():
+        async with check_domains.ResolverPool(threshold=1) as pool:
+            registered = await check_domains._dns_registered_async(pool, "ü" * 64 + ".com")
+            return registered, pool._benched_until
+
+    with patch("aiodns.DNSResolver") as mock_resolver:
+        mock_resolver.return_value.query_dns = AsyncMock(side_effect=UnicodeError("Label too long"))
+        mock_resolver.return_value.close = AsyncMock()
+        registered, benched_until = asyncio.run(lookup())
+
+    assert registered is None
+    assert benched_until == [0.0]
+
+
+def test_dns_registered_async_bad_name_is_not_a_resolver_failure():
+    """Test that only timeouts, refusals and SERVFAIL count against a resolver."""
+    errors = [aiodns.error.DNSError(aiodns.error.ARES_EBADNAME, "Misformatted domain name"),
+              aiodns.error.DNSError(aiodns.error.ARES_ENODATA, "DNS server returned answer with no data"),
+              aiodns.error.DNSError(aiodns.error.ARES_ESERVFAIL, "Server failed")]
+
+    async def lookup():
+        async with check_domains.ResolverPool(threshold=2) as pool:
+            results = [await check_domains._dns_registered_async(pool, "xn--caf bar-dya.com")
+                       for _ in range(3)]
+            return results, pool._failures
+
+    with patch("aiodns.DNSResolver") as mock_resolver:
+        mock_resolver.return_value.query_dns = AsyncMock(side_effect=errors)
+        mock_resolver.return_value.close = AsyncMock()
+        results, failures = asyncio.run(lookup())
+
+    assert results == [None, None, None]
+    assert failures == [1]
+
+
+def test_bulk_registered_parses_response():
+    """Test parsing a WHOISXML bulk availability response."""
+    payload = {"DomainInfo": [
+        {"domainName": "test.com", "domainAvailability": "UNAVAILABLE"},
+        {"domainName": "Free.com", "domainAvailability": "AVAILABLE"},
+        {"domainName": "odd.com"},
+        {"domainName": "unsure.com", "domainAvailability": "UNDETERMINED"}
+    ]}
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.read.return_value = json.dumps(payload).encode()
+
+    with patch("urllib.request.urlopen", return_value=response) as mock_urlopen:
+        result = check_domains._bulk_registered(["test.com", "free.com", "odd.com", "unsure.com"],
+                                                "key")
+
+    assert result == {"test.com": True, "free.com": False}
+    sent = json.loads(mock_urlopen.call_args.args[0].data)
+    assert sent["apiKey"] == "key"
+    assert sent["domainNames"] == ["test.com", "free.com", "odd.com", "unsure.com"]
+
+
+def test_bulk_registered_request_failure():
+    """Test that a failed bulk request answers nothing."""
+    with patch("urllib.request.urlopen", side_effect=OSError("Network is unreachable")):
+        assert check_domains._bulk_registered(["test.com"], "key") == {}
+
+
+@pytest.mark.parametrize("payload", [
+    42,
+    {"DomainInfo": "none"},
+    [{"domainName": 7, "domainAvailability": "AVAILABLE"}],
+])
+def test_bulk_registered_malformed_response(payload):
+    """Test that a response of the wrong shape answers nothing instead of raising."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.read.return_value = json.dumps(payload).encode()
+
+    with patch("urllib.request.urlopen", return_value=response):
+        assert check_domains._bulk_registered(["test.com"], "key") == {}
+
+
+def test_iter_available_domains_bulk_batches():
+    """Test batching domains and falling back to the thread pool for unanswered ones."""
+    domains = [("a.com", "a"), ("b.com", "b"), ("c.com", "c")]
+    answers = {"a.com": False, "b.com": True}
+
+    with patch("check_domains._bulk_registered",
+               side_effect=lambda batch, key: {d: answers[d] for d in batch if d in answers}
+               ) as mock_bulk, \
+         patch("check_domains._whois_registered", return_value=False) as mock_check, \
+         patch("check_domains.iter_available_domains",
+               wraps=check_domains.iter_available_domains) as mock_iter:
+        result = list(check_domains.iter_available_domains_bulk(domains, "key", batch_size=2,
+                                                                concurrency=5))
+
+    assert result == ["a.com", "c.com"]
+    assert [c.args[0] for c in mock_bulk.call_args_list] == [["a.com", "b.com"], ["c.com"]]
+    mock_check.assert_called_once_with("c.com")
+    mock_iter.assert_called_once_with([("c.com", "c")], None, 5, strict=False)
+
+
 def test_print_status(capsys):
     """Test printing status updates."""
     check_domains.print_status("example")
+    check_domains.flush_output()
     captured = capsys.readouterr()
     assert "Checking: example" in captured.out
 
 
+def test_print_status_is_buffered(capsys):
+    """Test that status lines are held back until the buffer fills or is flushed."""
+    check_domains.print_status("example")
+    assert capsys.readouterr().out == ""
+
+    check_domains.print_results(["test.com"])
+    assert capsys.readouterr().out == "Checking: example\nAvailable domains:\ntest.com\n"
+
+
 def test_print_results_with_domains(capsys):
     """Test printing results when domains are available."""
     available = ["test.com", "example.org"]
@@ -133,6 +831,27 @@ def test_print_results_with_domains(capsys):
     assert "example.org" in captured.out
 
 
+def test_print_results_streams_iterator(capsys):
+    """Test printing results from a generator of domains."""
+    check_domains.print_results(domain for domain in ["test.com", "example.org"])
+
+    captured = capsys.readouterr()
+    assert captured.out == "Available domains:\ntest.com\nexample.org\n"
+
+
+def test_print_results_async(capsys):
+    """Test printing results from an async iterator of domains."""
+    async def domains(names):
+        for name in names:
+            yield name
+
+    asyncio.run(check_domains.print_results_async(domains(["test.com"])))
+    asyncio.run(check_domains.print_results_async(domains([])))
+
+    captured = capsys.readouterr()
+    assert captured.out == "Available domains:\ntest.com\nNo available domains found.\n"
+
+
 def test_print_results_no_domains(capsys):
     """Test printing results when no domains are available."""
     check_domains.print_results([])
@@ -144,10 +863,95 @@ def test_print_results_no_domains(capsys):
 def test_parse_arguments():
     """Test argument parsing with default config path."""
     with patch("argparse.ArgumentParser.parse_args",
-               return_value=MagicMock(input_file="domains.txt", config="config.yaml")):
+               return_value=MagicMock(input_file="domains.txt", config="config.yaml",
+                                      concurrency=check_domains.DEFAULT_CONCURRENCY,
+                                      bulk_api_key=None, procs=None, bloom_dir=None)):
         args = check_domains.parse_arguments()
         assert args.input_file == "domains.txt"
         assert args.config == "config.yaml"
+        assert args.concurrency == check_domains.DEFAULT_CONCURRENCY
+
+
+def test_parse_arguments_concurrency():
+    """Test parsing the concurrency option."""
+    with patch("sys.argv", ["check_domains.py", "domains.txt", "--concurrency", "10"]):
+        args = check_domains.parse_arguments()
+        assert args.concurrency == 10
+
+
+@pytest.mark.parametrize("argv", [["--concurrency", "0"], ["--concurrency", "-5"],
+                                  ["--procs", "0"], ["--procs", "two"]])
+def test_parse_arguments_rejects_non_positive_counts(argv, capsys):
+    """Test that worker counts below one are argparse errors, not tracebacks."""
+    with patch("sys.argv", ["check_domains.py", "domains.txt"] + argv), \
+         pytest.raises(SystemExit):
+        check_domains.parse_arguments()
+    assert "argument" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("argv", [
+    ["--procs", "2", "--bulk-api-key", "key"],
+    ["--procs", "2", "--bloom-dir", "blooms"],
+    ["--bulk-api-key", "key", "--bloom-dir", "blooms"],
+    ["--procs", "2", "--purgatory-threshold", "3"],
+])
+def test_parse_arguments_rejects_unsupported_combinations(argv):
+    """Test that options the chosen engine would ignore are rejected."""
+    with patch("sys.argv", ["check_domains.py", "domains.txt"] + argv), \
+         pytest.raises(SystemExit):
+        check_domains.parse_arguments()
+
+
+def test_parse_arguments_cache_options():
+    """Test parsing the cache options."""
+    with patch("sys.argv", ["check_domains.py", "domains.txt", "--no-cache", "--cache-ttl", "60"]):
+        args = check_domains.parse_arguments()
+        assert args.no_cache is True
+        assert args.cache_ttl == 60
+
+
+def test_main_quiet_skips_status():
+    """Test that --quiet runs without a status callback."""
+    with patch("sys.argv", ["check_domains.py", "domains.txt", "--quiet", "--no-cache"]), \
+         patch("check_domains.load_config", return_value=["com"]), \
+         patch("check_domains.load_resolvers", return_value=[]), \
+         patch("check_domains.load_strings", return_value=["test"]), \
+         patch("check_domains.iter_available_domains_async") as mock_find_domains, \
+         patch("check_domains.print_results_async"):
+        check_domains.main()
+        assert mock_find_domains.call_args.args[1] is None
+
+
+def test_main_bulk_api():
+    """Test that --bulk-api-key switches main to the bulk API."""
+    with patch("sys.argv", ["check_domains.py", "domains.txt", "--bulk-api-key", "key",
+                            "--no-cache"]), \
+         patch("check_domains.load_config", return_value=["com"]), \
+         patch("check_domains.load_resolvers", return_value=[]), \
+         patch("check_domains.load_strings", return_value=["test"]), \
+         patch("check_domains.iter_available_domains_bulk",
+               return_value=iter(["test.com"])) as mock_bulk, \
+         patch("check_domains.iter_available_domains_async") as mock_async, \
+         patch("check_domains.print_results") as mock_print_results:
+        check_domains.main()
+        assert mock_bulk.call_args.args[1] == "key"
+        assert mock_bulk.call_args.kwargs["concurrency"] == check_domains.DEFAULT_CONCURRENCY
+        mock_async.assert_not_called()
+        mock_print_results.assert_called_once_with(mock_bulk.return_value)
+
+
+def test_main_procs():
+    """Test that --procs switches main to worker processes."""
+    with patch("sys.argv", ["check_domains.py", "domains.txt", "--procs", "4", "--no-cache"]), \
+         patch("check_domains.load_config", return_value=["com"]), \
+         patch("check_domains.load_resolvers", return_value=[]), \
+         patch("check_domains.load_strings", return_value=["test"]), \
+         patch("check_domains.iter_available_domains", return_value=iter([])) as mock_iter, \
+         patch("check_domains.iter_available_domains_async") as mock_async, \
+         patch("check_domains.print_results"):
+        check_domains.main()
+        assert mock_iter.call_args.args[3] == 4
+        mock_async.assert_not_called()
 
 
 def test_main_function():
@@ -155,16 +959,19 @@ def test_main_function():
     with patch("check_domains.parse_arguments") as mock_parse_args, \
          patch("check_domains.load_config") as mock_load_config, \
          patch("check_domains.load_strings") as mock_load_strings, \
+         patch("check_domains.load_resolvers", return_value=[]), \
          patch("check_domains.generate_domain_combinations") as mock_gen_combinations, \
-         patch("check_domains.find_available_domains") as mock_find_domains, \
-         patch("check_domains.print_results") as mock_print_results:
+         patch("check_domains.iter_available_domains_async") as mock_find_domains, \
+         patch("check_domains.print_results_async") as mock_print_results:
 
         # Configure mocks
-        mock_parse_args.return_value = MagicMock(input_file="domains.txt", config="config.yaml")
+        mock_parse_args.return_value = MagicMock(input_file="domains.txt", config="config.yaml",
+                                                 no_cache=True, bloom_dir=None,
+                                                 bulk_api_key=None, procs=None)
         mock_load_config.return_value = ["com", "org"]
         mock_load_strings.return_value = ["test", "example"]
         mock_gen_combinations.return_value = [("test.com", "test"), ("example.org", "example")]
-        mock_find_domains.return_value = ["test.com"]
+        mock_find_domains.return_value = available = MagicMock()
 
         # Run main function
         check_domains.main()
@@ -175,10 +982,10 @@ def test_main_function():
         mock_load_strings.assert_called_once_with("domains.txt")
         mock_gen_combinations.assert_called_once_with(["test", "example"], ["com", "org"])
         mock_find_domains.assert_called_once()
-        mock_print_results.assert_called_once_with(["test.com"])
+        mock_print_results.assert_called_once_with(available)
 
 
-def test_integration_with_files():
+def test_integration_with_files(capsys):
     """Integration test using temp files."""
     # Create temp files for config and input
     with tempfile.NamedTemporaryFile(mode='w', delete=False) as config_file:
@@ -189,19 +996,21 @@ def test_integration_with_files():
 
     try:
         # Mock the domain checker and main functions
-        with patch("check_domains.check_domain", return_value=False), \
+        with patch("check_domains._whois_registered", return_value=False), \
+             patch("check_domains.RdapClient.registered", new_callable=AsyncMock,
+                   return_value=None), \
              patch("check_domains.print_status"), \
-             patch("sys.argv", ["check_domains.py", input_file.name, "--config", config_file.name]), \
-             patch("check_domains.print_results") as mock_print:
+             patch("sys.argv", ["check_domains.py", input_file.name, "--config", config_file.name,
+                                   "--no-cache", "--strict"]):
 
             check_domains.main()
 
             # Verify results contain all expected domains
-            called_args = mock_print.call_args[0][0]
-            assert "test.com" in called_args
-            assert "test.net" in called_args
-            assert "example.com" in called_args
-            assert "example.net" in called_args
+            printed = capsys.readouterr().out.splitlines()
+            assert "test.com" in printed
+            assert "test.net" in printed
+            assert "example.com" in printed
+            assert "example.net" in printed
 
     finally:
         # Clean up temp files